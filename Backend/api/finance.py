@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import Session, select, func
 from datetime import datetime
 from typing import List
 
@@ -8,6 +8,7 @@ from api.deps import get_current_user
 from models.user import User
 from models.family import Family
 from models.finance import SavingsPayment, Goal, GoalContribution
+from models.archive import ArchivedSavingsPayment
 
 router = APIRouter()
 
@@ -28,9 +29,15 @@ def get_savings_status(user: User = Depends(get_current_user), session: Session
     )
     payment = session.exec(statement).first()
 
-    # 2. Policz sumę wszystkich oszczędności rodziny (prosta agregacja)
-    family_payments = session.exec(select(SavingsPayment).where(SavingsPayment.family_id == user.family_id)).all()
-    total_savings = sum(p.amount for p in family_payments)
+    # 2. Policz sumę wszystkich oszczędności rodziny (razem z wpłatami przeniesionymi do archiwum)
+    total_savings = session.exec(
+        select(func.coalesce(func.sum(SavingsPayment.amount), 0.0))
+        .where(SavingsPayment.family_id == user.family_id)
+    ).one()
+    total_savings += session.exec(
+        select(func.coalesce(func.sum(ArchivedSavingsPayment.amount), 0.0))
+        .where(ArchivedSavingsPayment.family_id == user.family_id)
+    ).one()
 
     return {
         "paid_this_month": payment is not None,
@@ -6,18 +6,34 @@ from api.deps import get_current_user
 from models.user import User
 from models.family import Family
 from models.task import Task, TaskComment
+from models.archive import ArchivedTask, ArchivedTaskComment
+from schemas.task import TaskRead
 from datetime import datetime
 
 router = APIRouter()
 
 
-# 1. Pobierz wszystkie zadania rodziny
-@router.get("/", response_model=List[Task])
-def get_tasks(user: User = Depends(get_current_user), session: Session = Depends(get_session)):
+# 1. Pobierz wszystkie zadania rodziny (opcjonalnie razem z archiwum)
+@router.get("/", response_model=List[TaskRead])
+def get_tasks(
+        include_archived: bool = False,
+        user: User = Depends(get_current_user),
+        session: Session = Depends(get_session)
+):
     if not user.family_id:
         return []
     statement = select(Task).where(Task.family_id == user.family_id).order_by(Task.deadline.asc())
-    return session.exec(statement).all()
+    tasks = [TaskRead(**t.model_dump()) for t in session.exec(statement).all()]
+    if not include_archived:
+        return tasks
+
+    archived = session.exec(select(ArchivedTask).where(ArchivedTask.family_id == user.family_id)).all()
+    tasks += [
+        TaskRead(archived_id=a.id, is_archived=True, **a.model_dump(exclude={"id", "original_id", "archived_at"}))
+        for a in archived
+    ]
+    # Tak jak w SQLite: zadania bez terminu na początku
+    return sorted(tasks, key=lambda t: (t.deadline is not None, t.deadline or datetime.min))
 
 # 2. Dodaj zadanie (z terminem)
 @router.post("/")
@@ -53,6 +69,7 @@ def complete_task(task_id: int, user: User = Depends(get_current_user), session:
         raise HTTPException(404, "Zadanie nie znalezione")
 
     task.status = "DONE"
+    task.completed_at = datetime.utcnow()
     session.add(task)
     session.commit()
     return {"msg": "Zadanie wykonane"}
@@ -161,4 +178,18 @@ def get_comments(task_id: int, user: User = Depends(get_current_user), session:
         raise HTTPException(404, "Brak dostępu")
 
     statement = select(TaskComment).where(TaskComment.task_id == task_id).order_by(TaskComment.created_at)
-    return session.exec(statement).all()
\ No newline at end of file
+    return session.exec(statement).all()
+
+
+@router.get("/archived/{archived_id}/comments", response_model=List[ArchivedTaskComment])
+def get_archived_comments(archived_id: int, user: User = Depends(get_current_user),
+                          session: Session = Depends(get_session)):
+    """Komentarze zadania z archiwum (archived_id z GET /tasks/?include_archived=true)."""
+    task = session.get(ArchivedTask, archived_id)
+    if not task or task.family_id != user.family_id:
+        raise HTTPException(404, "Brak dostępu")
+
+    statement = select(ArchivedTaskComment).where(
+        ArchivedTaskComment.archived_task_id == archived_id
+    ).order_by(ArchivedTaskComment.created_at)
+    return session.exec(statement).all()
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlmodel import Session, select, delete
+
+from core.config import settings
+from core.database import engine
+from models.archive import ArchivedTask, ArchivedTaskComment, ArchivedSavingsPayment, ArchivedGoalContribution
+from models.finance import SavingsPayment, Goal, GoalContribution
+from models.task import Task, TaskComment
+
+logger = logging.getLogger(__name__)
+
+
+def get_archive_cutoff(now: Optional[datetime] = None) -> datetime:
+    """
+    Zwraca datę, przed którą wiersze trafiają do archiwum.
+    Nigdy nie sięga do bieżącego miesiąca - /savings/pay sprawdza wpłaty z tego miesiąca tylko w tabeli głównej.
+    """
+    now = now or datetime.utcnow()
+    month_start = datetime(now.year, now.month, 1)
+    return min(now - timedelta(days=settings.ARCHIVE_AFTER_DAYS), month_start)
+
+
+def _delete_hot_rows(session: Session, model, ids) -> bool:
+    """
+    Usuwa wiersze z tabeli głównej przed zapisem do archiwum.
+    Jeśli inny proces zdążył je już przenieść, liczba usuniętych wierszy się nie zgodzi.
+    """
+    result = session.exec(delete(model).where(model.id.in_(ids)))
+    return result.rowcount == len(ids)
+
+
+def _abort_batch(session: Session, model) -> int:
+    """Wycofuje paczkę, którą przeniósł już inny proces."""
+    session.rollback()
+    logger.warning("Paczka %s przeniesiona już przez inny proces - pomijam", model.__name__)
+    return 0
+
+
+def _archive_tasks_batch(session: Session, cutoff: datetime, batch_size: int) -> int:
+    """Przenosi jedną paczkę zadań DONE (razem z komentarzami) do archiwum. Wiek liczony od wykonania."""
+    statement = select(Task).where(
+        Task.status == "DONE",
+        Task.completed_at < cutoff
+    ).order_by(Task.id).limit(batch_size)
+    tasks = [task.model_dump() for task in session.exec(statement).all()]
+    if not tasks:
+        return 0
+
+    task_ids = [task["id"] for task in tasks]
+    statement = select(TaskComment).where(TaskComment.task_id.in_(task_ids))
+    comments = [comment.model_dump() for comment in session.exec(statement).all()]
+
+    # Komentarze muszą zniknąć przed zadaniami (klucz obcy task_id)
+    if comments and not _delete_hot_rows(session, TaskComment, [comment["id"] for comment in comments]):
+        return _abort_batch(session, Task)
+    if not _delete_hot_rows(session, Task, task_ids):
+        return _abort_batch(session, Task)
+
+    archived_tasks = {}
+    for task in tasks:
+        task_id = task.pop("id")
+        archived_tasks[task_id] = ArchivedTask(original_id=task_id, **task)
+    session.add_all(archived_tasks.values())
+    # Potrzebujemy nowych ID z archiwum, żeby podpiąć pod nie komentarze
+    session.flush()
+
+    for comment in comments:
+        session.add(ArchivedTaskComment(
+            original_id=comment.pop("id"),
+            archived_task_id=archived_tasks[comment.pop("task_id")].id,
+            **comment
+        ))
+
+    session.commit()
+    return len(tasks)
+
+
+def _archive_savings_batch(session: Session, cutoff: datetime, batch_size: int) -> int:
+    """Przenosi jedną paczkę starych wpłat oszczędności do archiwum."""
+    statement = select(SavingsPayment).where(
+        SavingsPayment.date < cutoff
+    ).order_by(SavingsPayment.id).limit(batch_size)
+    payments = [payment.model_dump() for payment in session.exec(statement).all()]
+    if not payments:
+        return 0
+
+    if not _delete_hot_rows(session, SavingsPayment, [payment["id"] for payment in payments]):
+        return _abort_batch(session, SavingsPayment)
+
+    for payment in payments:
+        session.add(ArchivedSavingsPayment(original_id=payment.pop("id"), **payment))
+
+    session.commit()
+    return len(payments)
+
+
+def _archive_goal_contributions_batch(session: Session, cutoff: datetime, batch_size: int) -> int:
+    """Przenosi jedną paczkę starych wpłat na zrealizowane cele do archiwum."""
+    statement = select(GoalContribution).join(Goal, GoalContribution.goal_id == Goal.id).where(
+        Goal.is_completed == True,  # noqa: E712
+        GoalContribution.date < cutoff
+    ).order_by(GoalContribution.id).limit(batch_size)
+    contributions = [contribution.model_dump() for contribution in session.exec(statement).all()]
+    if not contributions:
+        return 0
+
+    if not _delete_hot_rows(session, GoalContribution, [contribution["id"] for contribution in contributions]):
+        return _abort_batch(session, GoalContribution)
+
+    # Goal.current_amount zostaje bez zmian, więc stan celu pozostaje poprawny
+    for contribution in contributions:
+        session.add(ArchivedGoalContribution(original_id=contribution.pop("id"), **contribution))
+
+    session.commit()
+    return len(contributions)
+
+
+def run_archival(now: Optional[datetime] = None, batch_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    Przenosi stare dane z tabel głównych do tabel archiwalnych.
+    Każda paczka to osobna, krótka transakcja, więc baza nie jest blokowana na długo.
+    """
+    cutoff = get_archive_cutoff(now)
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+
+    archived = {}
+    for name, archive_batch in (
+            ("tasks", _archive_tasks_batch),
+            ("savings_payments", _archive_savings_batch),
+            ("goal_contributions", _archive_goal_contributions_batch),
+    ):
+        total = 0
+        while True:
+            with Session(engine) as session:
+                moved = archive_batch(session, cutoff, batch_size)
+            total += moved
+            # moved == 0 kończy pętlę także przy batch_size <= 0 (LIMIT 0 / LIMIT -1 w SQLite)
+            if moved == 0 or moved < batch_size:
+                break
+        archived[name] = total
+
+    logger.info("Archiwizacja zakończona (cutoff=%s): %s", cutoff.isoformat(), archived)
+    return archived
+
+
+async def archive_periodically():
+    """
+    Pętla uruchamiana w lifespan aplikacji - archiwizuje co ARCHIVE_INTERVAL_SECONDS.
+    Pierwsze przejście dopiero po jednym interwale, żeby restart (np. --reload) nie odpalał archiwizacji.
+    """
+    while True:
+        await asyncio.sleep(settings.ARCHIVE_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(run_archival)
+        except Exception:
+            logger.exception("Archiwizacja nie powiodła się")
@@ -1,3 +1,4 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -5,6 +6,13 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Archiwizacja starych danych (zadania DONE, historia wpłat).
+    # Wystarczy włączyć w jednym procesie; równoległe przebiegi kilku workerów są bezpieczne, ale zbędne.
+    ARCHIVE_ENABLED: bool = False
+    ARCHIVE_AFTER_DAYS: int = 365
+    ARCHIVE_BATCH_SIZE: int = Field(500, gt=0)
+    ARCHIVE_INTERVAL_SECONDS: int = Field(24 * 60 * 60, gt=0)
+
     class Config:
         env_file = ".env"
 
@@ -1,3 +1,4 @@
+from sqlalchemy import inspect, text
 from sqlmodel import SQLModel, create_engine, Session
 
 sqlite_file_name = "database.db"
@@ -11,5 +12,17 @@ def get_session():
     with Session(engine) as session:
         yield session
 
+def add_missing_columns(engine):
+    """create_all nie zmienia istniejących tabel - nowe kolumny dopisujemy ręcznie."""
+    columns = {column["name"] for column in inspect(engine).get_columns("task")}
+    if "completed_at" not in columns:
+        with engine.begin() as connection:
+            connection.execute(text("ALTER TABLE task ADD COLUMN completed_at DATETIME"))
+            # Nie znamy daty wykonania starych zadań - wiek liczymy od momentu migracji
+            connection.execute(text(
+                "UPDATE task SET completed_at = CURRENT_TIMESTAMP WHERE status = 'DONE' AND completed_at IS NULL"
+            ))
+
 def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
\ No newline at end of file
+    SQLModel.metadata.create_all(engine)
+    add_missing_columns(engine)
\ No newline at end of file
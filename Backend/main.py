@@ -1,7 +1,10 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from core.config import settings
 from core.database import create_db_and_tables
+from core.archive import archive_periodically
 from api import auth, family, finance, task
 from api.deps import get_current_user
 from models.user import User
@@ -10,7 +13,12 @@ from schemas.auth import UserRead
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     create_db_and_tables()
+    archive_task = asyncio.create_task(archive_periodically()) if settings.ARCHIVE_ENABLED else None
     yield
+    if archive_task:
+        archive_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await archive_task
 
 app = FastAPI(lifespan=lifespan)
 
@@ -0,0 +1,67 @@
+from typing import Optional
+from sqlmodel import Field, SQLModel
+from datetime import datetime
+
+
+# Tabele archiwalne ("zimne") - te same kolumny co w tabelach głównych + archived_at.
+# Archiwum ma własne ID. SQLite może ponownie nadać stare ID w tabeli głównej,
+# więc oryginalne ID (original_id) nie jest unikalne i służy tylko informacyjnie.
+
+class ArchivedTask(SQLModel, table=True):
+    __tablename__ = "archived_task"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    original_id: int = Field(index=True)
+    title: str
+    description: Optional[str] = None
+    status: str = "DONE"
+    rating: Optional[int] = None
+    created_at: datetime
+    deadline: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    family_id: int = Field(foreign_key="family.id", index=True)
+    created_by_id: int = Field(foreign_key="user.id")
+    assigned_to_id: Optional[int] = Field(default=None, foreign_key="user.id")
+
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ArchivedTaskComment(SQLModel, table=True):
+    __tablename__ = "archived_task_comment"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    original_id: int
+    content: str
+    created_at: datetime
+
+    archived_task_id: int = Field(foreign_key="archived_task.id", index=True)
+    user_id: int = Field(foreign_key="user.id")
+
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ArchivedSavingsPayment(SQLModel, table=True):
+    __tablename__ = "archived_savings_payment"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    original_id: int
+    amount: float
+    date: datetime
+    user_id: int = Field(foreign_key="user.id")
+    family_id: int = Field(foreign_key="family.id", index=True)
+
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ArchivedGoalContribution(SQLModel, table=True):
+    __tablename__ = "archived_goal_contribution"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    original_id: int
+    amount: float
+    date: datetime
+    user_id: int = Field(foreign_key="user.id")
+    goal_id: int = Field(foreign_key="goal.id", index=True)
+
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
@@ -11,6 +11,7 @@ class Task(SQLModel, table=True):
     rating: Optional[int] = None  # 1-5
     created_at: datetime = Field(default_factory=datetime.utcnow)
     deadline: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
 
     # Klucze obce
     family_id: int = Field(foreign_key="family.id")
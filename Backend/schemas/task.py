@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class TaskRead(BaseModel):
+    # id - zadanie z tabeli głównej, archived_id - zadanie z archiwum (ID obu tabel mogą się powtarzać)
+    id: Optional[int] = None
+    archived_id: Optional[int] = None
+    is_archived: bool = False
+    title: str
+    description: Optional[str] = None
+    status: str
+    rating: Optional[int] = None
+    created_at: datetime
+    deadline: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    family_id: int
+    created_by_id: int
+    assigned_to_id: Optional[int] = None
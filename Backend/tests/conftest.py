@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+import core.archive
+from models.family import Family
+from models.user import User
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """Baza SQLite w pamięci, podpięta też pod archiwizację."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(core.archive, "engine", engine)
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def family(session):
+    family = Family(name="Kowalscy", invite_code="ABC123", owner_id=1, monthly_contribution=100.0)
+    session.add(family)
+    session.commit()
+    session.refresh(family)
+    return family
+
+
+@pytest.fixture
+def user(session, family):
+    user = User(email="jan@example.com", hashed_password="x", full_name="Jan", family_id=family.id)
+    session.add(user)
+    session.commit()
+    session.refresh(user)
+    return user
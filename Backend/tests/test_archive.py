@@ -0,0 +1,264 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import event, inspect, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from api.family import get_dashboard_alerts
+from api.finance import get_savings_status
+from api.task import get_tasks, get_comments, get_archived_comments
+import core.archive
+from core.archive import get_archive_cutoff, run_archival, _archive_savings_batch
+from core.config import Settings, settings
+from core.database import add_missing_columns
+from models.archive import ArchivedTask, ArchivedTaskComment, ArchivedSavingsPayment, ArchivedGoalContribution
+from models.family import Family
+from models.finance import SavingsPayment, Goal, GoalContribution
+from models.task import Task, TaskComment
+from models.user import User
+
+OLD = datetime.utcnow() - timedelta(days=400)
+
+
+def add_task(session, user, **kwargs):
+    task = Task(title=kwargs.pop("title", "Zadanie"), family_id=user.family_id, created_by_id=user.id, **kwargs)
+    session.add(task)
+    session.commit()
+    session.refresh(task)
+    return task
+
+
+def archive(session, **kwargs):
+    """Archiwizacja działa na własnych sesjach - czyścimy obiekty zapamiętane w sesji testu."""
+    result = run_archival(**kwargs)
+    session.expunge_all()
+    return result
+
+
+def add_payment(session, user, amount, date):
+    session.add(SavingsPayment(amount=amount, date=date, user_id=user.id, family_id=user.family_id))
+    session.commit()
+
+
+# --- Data graniczna ---
+
+def test_cutoff_uses_archive_after_days(monkeypatch):
+    monkeypatch.setattr(settings, "ARCHIVE_AFTER_DAYS", 365)
+    now = datetime(2026, 10, 19, 12, 0)
+    assert get_archive_cutoff(now) == now - timedelta(days=365)
+
+
+def test_cutoff_never_reaches_current_month(monkeypatch):
+    monkeypatch.setattr(settings, "ARCHIVE_AFTER_DAYS", 0)
+    assert get_archive_cutoff(datetime(2026, 10, 19, 12, 0)) == datetime(2026, 10, 1)
+
+
+def test_current_month_payment_stays_in_hot_table(monkeypatch, session, user):
+    monkeypatch.setattr(settings, "ARCHIVE_AFTER_DAYS", 0)
+    add_payment(session, user, 50.0, OLD)
+    add_payment(session, user, 100.0, datetime.utcnow())
+
+    assert archive(session)["savings_payments"] == 1
+
+    assert get_savings_status(user=user, session=session)["paid_this_month"] is True
+    assert get_dashboard_alerts(user=user, session=session)["savings_paid_this_month"] is True
+
+
+def test_total_savings_unchanged_after_archival(session, user):
+    add_payment(session, user, 50.0, OLD)
+    add_payment(session, user, 25.5, OLD)
+    add_payment(session, user, 100.0, datetime.utcnow())
+    before = get_savings_status(user=user, session=session)["total_family_savings"]
+
+    assert archive(session)["savings_payments"] == 2
+
+    assert get_savings_status(user=user, session=session)["total_family_savings"] == before == 175.5
+
+
+def test_concurrent_archivers_do_not_duplicate_rows(monkeypatch, tmp_path):
+    # Dwa "workery" na jednym pliku SQLite - drugi kończy paczkę między SELECT a DELETE pierwszego
+    url = f"sqlite:///{tmp_path / 'archive.db'}"
+    first_engine, second_engine = create_engine(url), create_engine(url)
+    SQLModel.metadata.create_all(first_engine)
+    monkeypatch.setattr(core.archive, "engine", second_engine)
+
+    with Session(first_engine) as session:
+        family = Family(name="Kowalscy", invite_code="ABC123", owner_id=1)
+        session.add(family)
+        session.commit()
+        user = User(email="jan@example.com", hashed_password="x", full_name="Jan", family_id=family.id)
+        session.add(user)
+        session.commit()
+        add_payment(session, user, 50.0, OLD)
+        add_payment(session, user, 25.0, OLD)
+        before = get_savings_status(user=user, session=session)["total_family_savings"]
+
+    second_worker_runs = []
+    with Session(first_engine) as session:
+        @event.listens_for(session, "do_orm_execute")
+        def run_second_worker(orm_execute_state):
+            if orm_execute_state.is_delete and not second_worker_runs:
+                second_worker_runs.append(run_archival())
+
+        assert _archive_savings_batch(session, get_archive_cutoff(), 500) == 0
+
+    assert second_worker_runs[0]["savings_payments"] == 2
+    with Session(first_engine) as session:
+        assert len(session.exec(select(ArchivedSavingsPayment)).all()) == 2
+        assert get_savings_status(user=user, session=session)["total_family_savings"] == before == 75.0
+
+
+# --- Zadania ---
+
+def test_archival_runs_in_batches_until_done(session, user):
+    for i in range(5):
+        add_task(session, user, title=f"Stare {i}", status="DONE", created_at=OLD, completed_at=OLD)
+    add_task(session, user, title="Niewykonane", status="TODO", created_at=OLD)
+
+    assert archive(session, batch_size=2)["tasks"] == 5
+    assert archive(session, batch_size=2)["tasks"] == 0
+
+    assert [t.title for t in session.exec(select(Task)).all()] == ["Niewykonane"]
+    assert len(session.exec(select(ArchivedTask)).all()) == 5
+
+
+@pytest.mark.parametrize("name", ["ARCHIVE_BATCH_SIZE", "ARCHIVE_INTERVAL_SECONDS"])
+@pytest.mark.parametrize("value", [0, -1])
+def test_archive_settings_must_be_positive(name, value):
+    with pytest.raises(ValidationError):
+        Settings(**{name: value})
+
+
+def test_archival_terminates_with_non_positive_batch_size(session, user):
+    add_task(session, user, status="DONE", created_at=OLD, completed_at=OLD)
+
+    # LIMIT -1 w SQLite oznacza brak limitu - jedno przejście, potem pusta paczka kończy pętlę
+    assert archive(session, batch_size=-1)["tasks"] == 1
+    assert session.exec(select(Task)).all() == []
+
+
+def test_task_age_counts_from_completion(session, user):
+    add_task(session, user, title="Skończone dziś", status="DONE", created_at=OLD, completed_at=datetime.utcnow())
+    add_task(session, user, title="Skończone dawno", status="DONE", created_at=OLD, completed_at=OLD)
+    # Zadanie sprzed migracji, któremu nie uzupełniono completed_at, nie znika od razu
+    add_task(session, user, title="Bez completed_at", status="DONE", created_at=OLD)
+
+    assert archive(session)["tasks"] == 1
+
+    assert {t.title for t in session.exec(select(Task)).all()} == {"Skończone dziś", "Bez completed_at"}
+    assert session.exec(select(ArchivedTask)).one().title == "Skończone dawno"
+
+
+def test_comments_move_with_their_task(session, user):
+    task = add_task(session, user, status="DONE", created_at=OLD, completed_at=OLD)
+    session.add(TaskComment(content="Brawo", task_id=task.id, user_id=user.id))
+    session.commit()
+
+    archive(session)
+
+    assert session.exec(select(TaskComment)).all() == []
+    archived_task = session.exec(select(ArchivedTask)).one()
+    archived_comment = session.exec(select(ArchivedTaskComment)).one()
+    assert archived_task.original_id == task.id
+    assert archived_comment.archived_task_id == archived_task.id
+    assert archived_comment.content == "Brawo"
+
+
+def test_reused_hot_id_is_archived_again(session, user):
+    first = add_task(session, user, title="Pierwsze", status="DONE", created_at=OLD, completed_at=OLD)
+    archive(session)
+
+    # Bez AUTOINCREMENT SQLite nadaje ponownie to samo ID
+    second = add_task(session, user, title="Drugie", status="DONE", created_at=OLD, completed_at=OLD)
+    assert second.id == first.id
+
+    assert archive(session)["tasks"] == 1
+    archived = session.exec(select(ArchivedTask).order_by(ArchivedTask.id)).all()
+    assert [(a.original_id, a.title) for a in archived] == [(first.id, "Pierwsze"), (first.id, "Drugie")]
+
+
+def test_completed_at_added_to_existing_task_table():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE task (id INTEGER PRIMARY KEY, title VARCHAR, status VARCHAR)"))
+        connection.execute(text("INSERT INTO task (title, status) VALUES ('Zrobione', 'DONE'), ('Otwarte', 'TODO')"))
+
+    add_missing_columns(engine)
+    add_missing_columns(engine)
+
+    assert "completed_at" in {column["name"] for column in inspect(engine).get_columns("task")}
+    with engine.connect() as connection:
+        rows = dict(connection.execute(text("SELECT title, completed_at FROM task")).all())
+    assert rows["Zrobione"] is not None
+    assert rows["Otwarte"] is None
+
+
+def test_get_tasks_include_archived_merges_and_sorts(session, user):
+    add_task(session, user, title="Archiwalne", status="DONE", created_at=OLD, completed_at=OLD,
+             deadline=datetime(2025, 3, 1))
+    archive(session)
+    add_task(session, user, title="Bez terminu")
+    add_task(session, user, title="Nowe", deadline=datetime(2026, 1, 1))
+    add_task(session, user, title="Najstarszy termin", deadline=datetime(2024, 1, 1))
+
+    hot = get_tasks(include_archived=False, user=user, session=session)
+    assert [t.title for t in hot] == ["Bez terminu", "Najstarszy termin", "Nowe"]
+
+    merged = get_tasks(include_archived=True, user=user, session=session)
+    assert [t.title for t in merged] == ["Bez terminu", "Najstarszy termin", "Archiwalne", "Nowe"]
+    archived = merged[2]
+    assert archived.is_archived and archived.id is None and archived.archived_id is not None
+    hot_ids = [t.id for t in merged if not t.is_archived]
+    assert len(hot_ids) == len(set(hot_ids)) == 3
+
+
+def test_archived_comments_are_scoped_to_family(session, user):
+    task = add_task(session, user, status="DONE", created_at=OLD, completed_at=OLD)
+    session.add(TaskComment(content="Tajne", task_id=task.id, user_id=user.id))
+    session.commit()
+    archive(session)
+    archived_id = session.exec(select(ArchivedTask)).one().id
+
+    other_family = Family(name="Nowakowie", invite_code="XYZ789", owner_id=2)
+    session.add(other_family)
+    session.commit()
+    other = User(email="anna@example.com", hashed_password="x", full_name="Anna", family_id=other_family.id)
+    session.add(other)
+    session.commit()
+    session.refresh(other)
+
+    # Nowe zadanie innej rodziny dostaje to samo ID co zarchiwizowane
+    reused = add_task(session, other)
+    assert reused.id == task.id
+    assert get_comments(task_id=reused.id, user=other, session=session) == []
+
+    with pytest.raises(HTTPException) as exc:
+        get_archived_comments(archived_id=archived_id, user=other, session=session)
+    assert exc.value.status_code == 404
+
+    comments = get_archived_comments(archived_id=archived_id, user=user, session=session)
+    assert [c.content for c in comments] == ["Tajne"]
+
+
+# --- Cele ---
+
+def test_only_completed_goal_contributions_are_archived(session, user):
+    done = Goal(name="Wakacje", target_amount=100, current_amount=100, is_completed=True,
+                family_id=user.family_id, created_by_id=user.id)
+    open_goal = Goal(name="Auto", target_amount=1000, current_amount=40,
+                     family_id=user.family_id, created_by_id=user.id)
+    session.add(done)
+    session.add(open_goal)
+    session.commit()
+    session.add(GoalContribution(amount=100, date=OLD, user_id=user.id, goal_id=done.id))
+    session.add(GoalContribution(amount=40, date=OLD, user_id=user.id, goal_id=open_goal.id))
+    session.commit()
+
+    assert archive(session)["goal_contributions"] == 1
+
+    assert session.exec(select(GoalContribution)).one().goal_id == open_goal.id
+    assert session.exec(select(ArchivedGoalContribution)).one().goal_id == done.id
+    assert session.get(Goal, done.id).current_amount == 100